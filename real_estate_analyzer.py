@@ -1,37 +1,57 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 import json
 
+# Numba is optional: the kernel below runs as plain NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 # Page config
 st.set_page_config(page_title="Real Estate Deal Analyzer", page_icon="🏠", layout="wide")
 
-# Initialize session state for saved properties
+# Cost assumptions (candidates for sidebar overrides later)
+MLS_PREP_COSTS = 24_500  # paint, clean, repairs, staging, landscaping, misc
+MLS_HOLDING_COSTS_60D = 2_933  # 2 months property tax, utilities, insurance
+BUYER_MONTHLY_HOLDING = 1_467  # property tax, utilities, insurance
+LOAN_ORIGINATION_PCT = 0.01
+FIXED_CLOSING_FEES = 4_300  # escrow, title, inspection, appraisal, recording
+SELLER_AGENT_PCT = 0.03  # paid by the buyer on acquisition
+SALE_COMMISSION_PCT = 0.04  # total commission when the flip sells
+TRANSFER_TAX_PCT = 0.0011
+FIXED_SELLING_FEES = 3_000
+SELLING_PCT = SALE_COMMISSION_PCT + TRANSFER_TAX_PCT + FIXED_SELLING_FEES / 1_000_000
+
+# Initialize session state for saved properties, keyed by a stable id so
+# deletes are O(1) and widget keys survive reruns
 if 'properties' not in st.session_state:
-    st.session_state.properties = []
+    st.session_state.properties = {}
+    st.session_state._next_id = 0
 
 # Helper functions
-def calculate_seller_net(price, is_mls=True):
-    """Calculate seller net proceeds"""
-    listing_agent = price * 0.03
-    buyer_agent = price * 0.02 if is_mls else 0
-    
-    if is_mls:
-        prep_costs = 8000 + 6000 + 1500 + 5000 + 3000 + 1000  # paint, clean, repairs, staging, landscaping
-        holding_costs = 2000 + 600 + 333  # 2 months property tax, utilities, insurance
-    else:
-        prep_costs = 0
-        holding_costs = 0
-    
-    transfer_tax = price * 0.0011
+def calculate_seller_net_vec(prices, is_mls):
+    """Calculate seller net proceeds for all scenarios at once (struct-of-arrays)"""
+    listing_agent = prices * 0.03
+    buyer_agent = np.where(is_mls, prices * 0.02, 0.0)
+
+    prep_costs = np.where(is_mls, float(MLS_PREP_COSTS), 0.0)
+    holding_costs = np.where(is_mls, float(MLS_HOLDING_COSTS_60D), 0.0)
+
+    transfer_tax = prices * TRANSFER_TAX_PCT
     escrow_fees = 1500
-    
+
     total_costs = listing_agent + buyer_agent + prep_costs + holding_costs + transfer_tax + escrow_fees
-    net = price - total_costs
-    
+    net = prices - total_costs
+
     return {
-        'price': price,
+        'price': prices,
         'listing_agent': listing_agent,
         'buyer_agent': buyer_agent,
         'prep_costs': prep_costs,
@@ -41,17 +61,33 @@ def calculate_seller_net(price, is_mls=True):
         'net': net
     }
 
+# Cached so single-property callers with unchanged inputs reuse the memoized result
+@st.cache_data(show_spinner=False)
+def calculate_seller_net(price, is_mls=True):
+    """Calculate seller net proceeds for a single scenario"""
+    vec = calculate_seller_net_vec(np.array([price], dtype=float), np.array([is_mls]))
+    return {key: float(value[0]) for key, value in vec.items()}
+
+def _fmt_usd_signed(value):
+    """Format a float as $X,XXX, with costs rendered as -$X,XXX"""
+    return f"-${-value:,.0f}" if value < 0 else f"${value:,.0f}"
+
+def _fmt_usd_waived(value):
+    """Like _fmt_usd_signed, but mark waived ($0) cost lines with a check"""
+    return "$0 ✓" if value == 0 else _fmt_usd_signed(value)
+
+@st.cache_data(show_spinner=False)
 def calculate_buyer_costs(purchase_price, down_pct, interest_rate, remodel_cost, months=4):
     """Calculate buyer all-in costs"""
     down_payment = purchase_price * (down_pct / 100)
     loan_amount = purchase_price * (1 - down_pct / 100)
     
     # Closing costs
-    loan_origination = loan_amount * 0.01
-    closing_costs = loan_origination + 600 + 500 + 1500 + 1500 + 200
-    
+    loan_origination = loan_amount * LOAN_ORIGINATION_PCT
+    closing_costs = loan_origination + FIXED_CLOSING_FEES
+
     # Seller's agent commission
-    seller_agent = purchase_price * 0.03
+    seller_agent = purchase_price * SELLER_AGENT_PCT
     
     # Cash to acquire
     cash_to_acquire = down_payment + closing_costs + seller_agent
@@ -59,8 +95,7 @@ def calculate_buyer_costs(purchase_price, down_pct, interest_rate, remodel_cost,
     # Holding costs
     monthly_interest = (loan_amount * (interest_rate / 100)) / 12
     total_interest = monthly_interest * months
-    monthly_holding = 1000 + 300 + 167  # property tax, utilities, insurance
-    holding_costs = total_interest + (monthly_holding * months)
+    holding_costs = total_interest + (BUYER_MONTHLY_HOLDING * months)
     
     # Total cash invested
     total_cash = cash_to_acquire + holding_costs + remodel_cost
@@ -78,14 +113,15 @@ def calculate_buyer_costs(purchase_price, down_pct, interest_rate, remodel_cost,
         'total_cash': total_cash
     }
 
-def calculate_flip_profit(buy_costs, sell_price):
+@st.cache_data(show_spinner=False)
+def calculate_flip_profit(loan_amount, total_cash, sell_price):
     """Calculate profit from flip"""
-    commission_4pct = sell_price * 0.04
-    transfer_fees = (sell_price * 0.0011) + 3000
-    
-    net_proceeds = sell_price - commission_4pct - transfer_fees - buy_costs['loan_amount']
-    profit = net_proceeds - buy_costs['total_cash']
-    roi = (profit / buy_costs['total_cash']) * 100
+    commission_4pct = sell_price * SALE_COMMISSION_PCT
+    transfer_fees = (sell_price * TRANSFER_TAX_PCT) + FIXED_SELLING_FEES
+
+    net_proceeds = sell_price - commission_4pct - transfer_fees - loan_amount
+    profit = net_proceeds - total_cash
+    roi = (profit / total_cash) * 100
     
     return {
         'sell_price': sell_price,
@@ -96,83 +132,184 @@ def calculate_flip_profit(buy_costs, sell_price):
         'roi': roi
     }
 
+@st.cache_data(show_spinner=False)
+def _props_df(props_tuple):
+    """Saved-properties table; cached on the session dict contents"""
+    return pd.DataFrame([{'id': pid, 'delete': False, **prop} for pid, prop in props_tuple])
+
+def _flip_profit_kernel(purchase, down_pct, rate, remodel, months, sale_prices):
+    """Flip arithmetic over an array of sale prices; JIT-compiled via _get_flip_kernel"""
+    down_payment = purchase * (down_pct / 100.0)
+    loan_amount = purchase * (1.0 - down_pct / 100.0)
+    closing_costs = loan_amount * LOAN_ORIGINATION_PCT + FIXED_CLOSING_FEES
+    seller_agent = purchase * SELLER_AGENT_PCT
+    cash_to_acquire = down_payment + closing_costs + seller_agent
+
+    total_interest = (loan_amount * (rate / 100.0)) / 12.0 * months
+    holding_costs = total_interest + BUYER_MONTHLY_HOLDING * months
+    total_cash = cash_to_acquire + holding_costs + remodel
+
+    commission = sale_prices * SALE_COMMISSION_PCT
+    transfer_fees = sale_prices * TRANSFER_TAX_PCT + FIXED_SELLING_FEES
+    net_proceeds = sale_prices - commission - transfer_fees - loan_amount
+    profit = net_proceeds - total_cash
+    roi = profit / total_cash * 100.0
+
+    return profit, roi, net_proceeds, cash_to_acquire, total_cash
+
+@st.cache_resource(show_spinner=False)
+def _get_flip_kernel():
+    """Compile and pre-warm the flip kernel once per process, not on every rerun"""
+    kernel = njit(cache=True, fastmath=True)(_flip_profit_kernel)
+    kernel(100.0, 10.0, 6.0, 0.0, 1.0, np.array([100.0]))
+    return kernel
+
+# Warm during initial page load so the first Buyer/Flip view doesn't pay
+# compile time; on later reruns this is just a resource-cache lookup
+_get_flip_kernel()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_roi_figure(sale_prices, rois):
+    """Build the ROI bar chart; cached so only new price/ROI combos pay for construction"""
+    fig = go.Figure(data=[
+        go.Bar(
+            x=[f"${sp/1000:.0f}K" for sp in sale_prices],
+            y=list(rois),
+            text=[f"{r:.1f}%" for r in rois],
+            textposition='auto',
+            marker_color=['red' if r < 0 else 'green' if r > 15 else 'orange' for r in rois]
+        )
+    ])
+
+    fig.update_layout(
+        title="ROI by Sale Price",
+        xaxis_title="Sale Price",
+        yaxis_title="ROI %",
+        showlegend=False,
+        height=400
+    )
+
+    return fig
+
 # Main App
 st.title("🏠 Real Estate Deal Analyzer")
 st.markdown("---")
 
 # Sidebar - Property Input
-with st.sidebar:
+def _numeric_inputs():
+    """Numeric property and deal inputs; values land in st.session_state via widget keys"""
     st.header("Property Details")
-    
-    property_name = st.text_input("Property Name/Address", "38173 Canyon Oaks Ct")
-    
+
     col1, col2 = st.columns(2)
     with col1:
-        bedrooms = st.number_input("Beds", min_value=1, value=4)
-        sqft = st.number_input("Sq Ft", min_value=100, value=2523)
+        st.number_input("Beds", min_value=1, value=4, key='bedrooms')
+        st.number_input("Sq Ft", min_value=100, value=2523, key='sqft')
     with col2:
-        bathrooms = st.number_input("Baths", min_value=1, value=3)
-        year_built = st.number_input("Year Built", min_value=1900, value=1991)
-    
+        st.number_input("Baths", min_value=1, value=3, key='bathrooms')
+        st.number_input("Year Built", min_value=1900, value=1991, key='year_built')
+
     st.markdown("---")
     st.header("Deal Parameters")
-    
-    analysis_type = st.radio("Analysis Type", ["Seller Analysis", "Buyer/Flip Analysis", "Both"])
-    
-    if analysis_type in ["Seller Analysis", "Both"]:
+
+    st.radio("Analysis Type", ["Seller Analysis", "Buyer/Flip Analysis", "Both"], key='analysis_type')
+
+    if st.session_state.analysis_type in ["Seller Analysis", "Both"]:
         st.subheader("Seller Scenario")
-        mls_price = st.number_input("Expected MLS Sale Price", min_value=0, value=950000, step=10000)
-        direct_offer_1 = st.number_input("Direct Offer #1", min_value=0, value=850000, step=10000)
-        direct_offer_2 = st.number_input("Direct Offer #2", min_value=0, value=875000, step=10000)
-        direct_offer_3 = st.number_input("Direct Offer #3", min_value=0, value=900000, step=10000)
-    
-    if analysis_type in ["Buyer/Flip Analysis", "Both"]:
+        st.number_input("Expected MLS Sale Price", min_value=0, value=950000, step=10000, key='mls_price')
+        st.number_input("Direct Offer #1", min_value=0, value=850000, step=10000, key='direct_offer_1')
+        st.number_input("Direct Offer #2", min_value=0, value=875000, step=10000, key='direct_offer_2')
+        st.number_input("Direct Offer #3", min_value=0, value=900000, step=10000, key='direct_offer_3')
+
+    if st.session_state.analysis_type in ["Buyer/Flip Analysis", "Both"]:
         st.subheader("Buyer Scenario")
-        purchase_price = st.number_input("Purchase Price", min_value=0, value=900000, step=10000)
-        down_payment_pct = st.slider("Down Payment %", 5, 50, 10, 5)
-        interest_rate = st.slider("Interest Rate %", 3.0, 10.0, 6.0, 0.25)
-        remodel_cost = st.number_input("Remodel Cost", min_value=0, value=100000, step=5000)
-        remodel_months = st.slider("Remodel Timeline (months)", 1, 12, 4)
-        
+        st.number_input("Purchase Price", min_value=0, value=900000, step=10000, key='purchase_price')
+        st.slider("Down Payment %", 5, 50, 10, 5, key='down_payment_pct')
+        st.slider("Interest Rate %", 3.0, 10.0, 6.0, 0.25, key='interest_rate')
+        st.number_input("Remodel Cost", min_value=0, value=100000, step=5000, key='remodel_cost')
+        st.slider("Remodel Timeline (months)", 1, 12, 4, key='remodel_months')
+
         st.subheader("Sale Price Scenarios")
-        sale_price_1 = st.number_input("Sale Price #1", min_value=0, value=1100000, step=10000)
-        sale_price_2 = st.number_input("Sale Price #2", min_value=0, value=1120000, step=10000)
-        sale_price_3 = st.number_input("Sale Price #3", min_value=0, value=1150000, step=10000)
-    
-    st.markdown("---")
-    
-    notes = st.text_area("Notes", placeholder="e.g., backs to mobile home park, needs foundation work, etc.")
-    
+        st.number_input("Sale Price #1", min_value=0, value=1100000, step=10000, key='sale_price_1')
+        st.number_input("Sale Price #2", min_value=0, value=1120000, step=10000, key='sale_price_2')
+        st.number_input("Sale Price #3", min_value=0, value=1150000, step=10000, key='sale_price_3')
+
+@st.fragment
+def _metadata_inputs():
+    """Text metadata and Save button; fragment-scoped so typing here doesn't rerun the analysis"""
+    st.text_input("Property Name/Address", "38173 Canyon Oaks Ct", key='property_name')
+
+    st.text_area("Notes", placeholder="e.g., backs to mobile home park, needs foundation work, etc.",
+                 key='notes')
+
     if st.button("💾 Save Property", type="primary"):
         property_data = {
-            'name': property_name,
-            'bedrooms': bedrooms,
-            'bathrooms': bathrooms,
-            'sqft': sqft,
-            'year_built': year_built,
-            'notes': notes,
+            'name': st.session_state.property_name,
+            'bedrooms': st.session_state.bedrooms,
+            'bathrooms': st.session_state.bathrooms,
+            'sqft': st.session_state.sqft,
+            'year_built': st.session_state.year_built,
+            'notes': st.session_state.notes,
             'saved_date': datetime.now().strftime("%Y-%m-%d %H:%M")
         }
-        st.session_state.properties.append(property_data)
-        st.success(f"✅ Saved {property_name}")
+        pid = st.session_state._next_id
+        st.session_state._next_id += 1
+        st.session_state.properties[pid] = property_data
+        # Full-app rerun so the save shows up outside the fragment
+        # (e.g. in the Saved Properties view) right away; the success
+        # message is flagged in session state to survive the rerun
+        st.session_state._saved_name = st.session_state.property_name
+        st.rerun(scope="app")
 
-# Main Content Area
-tab1, tab2, tab3 = st.tabs(["📊 Analysis", "📁 Saved Properties", "ℹ️ About"])
+    saved_name = st.session_state.pop('_saved_name', None)
+    if saved_name:
+        st.success(f"✅ Saved {saved_name}")
+
+with st.sidebar:
+    _numeric_inputs()
+    st.markdown("---")
+    _metadata_inputs()
 
-with tab1:
+# Analysis reads the widget values back out of session state
+analysis_type = st.session_state.analysis_type
+
+# Main Content Area. A radio instead of st.tabs: tab bodies all execute on
+# every rerun, whereas these branches only run for the view being looked at.
+st.radio("View", ["📊 Analysis", "📁 Saved Properties", "ℹ️ About"],
+         horizontal=True, label_visibility="collapsed", key='active_tab')
+
+if st.session_state.active_tab == "📊 Analysis":
     if analysis_type in ["Seller Analysis", "Both"]:
         st.header("Seller Net Proceeds Analysis")
         st.markdown("**Comparison: Traditional MLS vs. Direct Sale**")
-        
-        # Calculate all scenarios
-        mls_calc = calculate_seller_net(mls_price, is_mls=True)
-        offer1_calc = calculate_seller_net(direct_offer_1, is_mls=False)
-        offer2_calc = calculate_seller_net(direct_offer_2, is_mls=False)
-        offer3_calc = calculate_seller_net(direct_offer_3, is_mls=False)
-        
-        # Create comparison table
-        comparison_data = {
-            'Cost Item': [
+
+        mls_price = st.session_state.mls_price
+        direct_offer_1 = st.session_state.direct_offer_1
+        direct_offer_2 = st.session_state.direct_offer_2
+        direct_offer_3 = st.session_state.direct_offer_3
+
+        # Calculate all scenarios in one vectorized pass (MLS first, then offers)
+        seller = calculate_seller_net_vec(
+            np.array([mls_price, direct_offer_1, direct_offer_2, direct_offer_3], dtype=float),
+            np.array([True, False, False, False])
+        )
+
+        # Create comparison table: one (9, 4) float matrix, formatted in one
+        # Styler pass instead of four hand-built columns of f-strings
+        matrix = np.vstack([
+            seller['price'],
+            -seller['listing_agent'],
+            -seller['buyer_agent'],
+            -seller['prep_costs'],
+            -seller['holding_costs'],
+            -seller['transaction_costs'],
+            -seller['total_costs'],
+            seller['net'],
+            seller['net'] - seller['net'][0]
+        ])
+
+        df_comparison = pd.DataFrame(
+            matrix,
+            index=[
                 'Gross Sale Price',
                 'Listing Agent (3%)',
                 'Buyer Agent',
@@ -183,68 +320,33 @@ with tab1:
                 'NET TO SELLER',
                 'Difference vs MLS'
             ],
-            f'MLS @ ${mls_price/1000:.0f}K': [
-                f"${mls_calc['price']:,.0f}",
-                f"-${mls_calc['listing_agent']:,.0f}",
-                f"-${mls_calc['buyer_agent']:,.0f}",
-                f"-${mls_calc['prep_costs']:,.0f}",
-                f"-${mls_calc['holding_costs']:,.0f}",
-                f"-${mls_calc['transaction_costs']:,.0f}",
-                f"-${mls_calc['total_costs']:,.0f}",
-                f"${mls_calc['net']:,.0f}",
-                f"$0"
-            ],
-            f'Offer ${direct_offer_1/1000:.0f}K': [
-                f"${offer1_calc['price']:,.0f}",
-                f"-${offer1_calc['listing_agent']:,.0f}",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"-${offer1_calc['transaction_costs']:,.0f}",
-                f"-${offer1_calc['total_costs']:,.0f}",
-                f"${offer1_calc['net']:,.0f}",
-                f"${offer1_calc['net'] - mls_calc['net']:,.0f}"
-            ],
-            f'Offer ${direct_offer_2/1000:.0f}K': [
-                f"${offer2_calc['price']:,.0f}",
-                f"-${offer2_calc['listing_agent']:,.0f}",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"-${offer2_calc['transaction_costs']:,.0f}",
-                f"-${offer2_calc['total_costs']:,.0f}",
-                f"${offer2_calc['net']:,.0f}",
-                f"${offer2_calc['net'] - mls_calc['net']:,.0f}"
-            ],
-            f'Offer ${direct_offer_3/1000:.0f}K': [
-                f"${offer3_calc['price']:,.0f}",
-                f"-${offer3_calc['listing_agent']:,.0f}",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"$0 ✓",
-                f"-${offer3_calc['transaction_costs']:,.0f}",
-                f"-${offer3_calc['total_costs']:,.0f}",
-                f"${offer3_calc['net']:,.0f}",
-                f"${offer3_calc['net'] - mls_calc['net']:,.0f}"
+            columns=[
+                f'MLS @ ${mls_price/1000:.0f}K',
+                f'Offer ${direct_offer_1/1000:.0f}K',
+                f'Offer ${direct_offer_2/1000:.0f}K',
+                f'Offer ${direct_offer_3/1000:.0f}K'
             ]
-        }
-        
-        df_comparison = pd.DataFrame(comparison_data)
-        st.dataframe(df_comparison, use_container_width=True, hide_index=True)
+        )
+
+        styled_comparison = df_comparison.style.format(_fmt_usd_signed).format(
+            _fmt_usd_waived,
+            subset=pd.IndexSlice[['Buyer Agent', 'Prep Costs', 'Holding Costs (60 days)'], :]
+        )
+        st.dataframe(styled_comparison, use_container_width=True)
         
         # Key Insights
         st.markdown("### 💡 Key Insights")
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            savings = mls_calc['buyer_agent'] + mls_calc['prep_costs'] + mls_calc['holding_costs']
+            savings = seller['buyer_agent'][0] + seller['prep_costs'][0] + seller['holding_costs'][0]
             st.metric("Cost Savings (Direct Sale)", f"${savings:,.0f}")
         
         with col2:
-            best_offer = max([offer1_calc['net'], offer2_calc['net'], offer3_calc['net']])
-            diff = best_offer - mls_calc['net']
+            best_offer = max([seller['net'][1], seller['net'][2], seller['net'][3]])
+            diff = best_offer - seller['net'][0]
             st.metric("Best Offer Gap vs MLS", f"${diff:,.0f}", 
-                     delta=f"{(diff/mls_calc['net']*100):.1f}%",
+                     delta=f"{(diff/seller['net'][0]*100):.1f}%",
                      delta_color="inverse")
         
         with col3:
@@ -255,7 +357,16 @@ with tab1:
     
     if analysis_type in ["Buyer/Flip Analysis", "Both"]:
         st.header("Buyer/Flip Analysis")
-        
+
+        purchase_price = st.session_state.purchase_price
+        down_payment_pct = st.session_state.down_payment_pct
+        interest_rate = st.session_state.interest_rate
+        remodel_cost = st.session_state.remodel_cost
+        remodel_months = st.session_state.remodel_months
+        sale_price_1 = st.session_state.sale_price_1
+        sale_price_2 = st.session_state.sale_price_2
+        sale_price_3 = st.session_state.sale_price_3
+
         # Calculate buyer costs
         buy_costs = calculate_buyer_costs(purchase_price, down_payment_pct, interest_rate, remodel_cost, remodel_months)
         
@@ -276,61 +387,47 @@ with tab1:
         # Calculate profit scenarios
         st.subheader("💰 Profit Scenarios")
         
-        profit1 = calculate_flip_profit(buy_costs, sale_price_1)
-        profit2 = calculate_flip_profit(buy_costs, sale_price_2)
-        profit3 = calculate_flip_profit(buy_costs, sale_price_3)
-        
-        profit_data = {
-            'Sale Price': [f"${sale_price_1:,.0f}", f"${sale_price_2:,.0f}", f"${sale_price_3:,.0f}"],
-            'Gross Proceeds': [f"${p['sell_price']:,.0f}" for p in [profit1, profit2, profit3]],
-            'Commission (4%)': [f"-${p['commission']:,.0f}" for p in [profit1, profit2, profit3]],
-            'Fees': [f"-${p['transfer_fees']:,.0f}" for p in [profit1, profit2, profit3]],
-            'Loan Payoff': [f"-${buy_costs['loan_amount']:,.0f}"] * 3,
-            'Net Proceeds': [f"${p['net_proceeds']:,.0f}" for p in [profit1, profit2, profit3]],
-            'Cash Invested': [f"-${buy_costs['total_cash']:,.0f}"] * 3,
-            'NET PROFIT': [f"${p['profit']:,.0f}" for p in [profit1, profit2, profit3]],
-            'ROI': [f"{p['roi']:.1f}%" for p in [profit1, profit2, profit3]]
-        }
-        
-        df_profit = pd.DataFrame(profit_data)
+        # All three sale scenarios in one vectorized pass
+        sale_prices = np.array([sale_price_1, sale_price_2, sale_price_3], dtype=float)
+        commission = sale_prices * SALE_COMMISSION_PCT
+        transfer_fees = sale_prices * TRANSFER_TAX_PCT + FIXED_SELLING_FEES
+        profit, roi, net_proceeds, _, _ = _get_flip_kernel()(
+            float(purchase_price), float(down_payment_pct), float(interest_rate),
+            float(remodel_cost), float(remodel_months), sale_prices
+        )
+
+        fmt_usd = "${:,.0f}".format
+        fmt_usd_neg = "-${:,.0f}".format
+        df_profit = pd.DataFrame({
+            'Sale Price': pd.Series(sale_prices).map(fmt_usd),
+            'Gross Proceeds': pd.Series(sale_prices).map(fmt_usd),
+            'Commission (4%)': pd.Series(commission).map(fmt_usd_neg),
+            'Fees': pd.Series(transfer_fees).map(fmt_usd_neg),
+            'Loan Payoff': fmt_usd_neg(buy_costs['loan_amount']),
+            'Net Proceeds': pd.Series(net_proceeds).map(fmt_usd),
+            'Cash Invested': fmt_usd_neg(buy_costs['total_cash']),
+            'NET PROFIT': pd.Series(profit).map(fmt_usd),
+            'ROI': pd.Series(roi).map("{:.1f}%".format)
+        })
         st.dataframe(df_profit, use_container_width=True, hide_index=True)
         
         # ROI Chart
         st.subheader("📈 ROI Comparison")
         
-        fig = go.Figure(data=[
-            go.Bar(
-                x=[f"${sale_price_1/1000:.0f}K", f"${sale_price_2/1000:.0f}K", f"${sale_price_3/1000:.0f}K"],
-                y=[profit1['roi'], profit2['roi'], profit3['roi']],
-                text=[f"{p['roi']:.1f}%" for p in [profit1, profit2, profit3]],
-                textposition='auto',
-                marker_color=['red' if p['roi'] < 0 else 'green' if p['roi'] > 15 else 'orange' 
-                             for p in [profit1, profit2, profit3]]
-            )
-        ])
-        
-        fig.update_layout(
-            title="ROI by Sale Price",
-            xaxis_title="Sale Price",
-            yaxis_title="ROI %",
-            showlegend=False,
-            height=400
-        )
-        
+        fig = _build_roi_figure(tuple(sale_prices), tuple(roi))
         st.plotly_chart(fig, use_container_width=True)
         
         # Breakeven calculation
         total_all_in = buy_costs['total_cash'] + buy_costs['loan_amount']
-        selling_percent = 0.04 + 0.0011 + (3000 / 1000000)
-        breakeven_price = total_all_in / (1 - selling_percent)
+        breakeven_price = total_all_in / (1 - SELLING_PCT)
         
         st.info(f"🎯 **Breakeven Sale Price:** ${breakeven_price:,.0f}")
         
         # Decision helper
         st.subheader("🎯 Deal Assessment")
         
-        best_roi = max([profit1['roi'], profit2['roi'], profit3['roi']])
-        best_profit = max([profit1['profit'], profit2['profit'], profit3['profit']])
+        best_roi = roi.max()
+        best_profit = profit.max()
         
         if best_roi < 0:
             st.error(f"⚠️ **WARNING:** All scenarios show negative returns. Highest ROI is {best_roi:.1f}%. Reconsider this deal.")
@@ -341,30 +438,40 @@ with tab1:
         else:
             st.success(f"🎉 **STRONG DEAL:** Best ROI is {best_roi:.1f}% with profit of ${best_profit:,.0f}. Excellent margins!")
 
-with tab2:
+elif st.session_state.active_tab == "📁 Saved Properties":
     st.header("📁 Saved Properties")
     
     if len(st.session_state.properties) == 0:
         st.info("No properties saved yet. Use the sidebar to add properties.")
     else:
-        for idx, prop in enumerate(st.session_state.properties):
-            with st.expander(f"{prop['name']} - {prop['bedrooms']}bd/{prop['bathrooms']}ba, {prop['sqft']} sqft"):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.write(f"**Year Built:** {prop['year_built']}")
-                    st.write(f"**Saved:** {prop['saved_date']}")
-                with col2:
-                    st.write(f"**Size:** {prop['sqft']} sqft")
-                    st.write(f"**Beds/Baths:** {prop['bedrooms']}/{prop['bathrooms']}")
-                with col3:
-                    if st.button(f"🗑️ Delete", key=f"del_{idx}"):
-                        st.session_state.properties.pop(idx)
-                        st.rerun()
-                
-                if prop.get('notes'):
-                    st.markdown(f"**Notes:** {prop['notes']}")
-
-with tab3:
+        # One cached DataFrame + data_editor instead of an expander per property
+        df_props = _props_df(tuple(st.session_state.properties.items()))
+        edited = st.data_editor(
+            df_props,
+            use_container_width=True,
+            hide_index=True,
+            disabled=[col for col in df_props.columns if col != 'delete'],
+            column_config={
+                'id': None,
+                'delete': st.column_config.CheckboxColumn('🗑️ Delete'),
+                'name': 'Property',
+                'bedrooms': 'Beds',
+                'bathrooms': 'Baths',
+                'sqft': 'Sq Ft',
+                'year_built': 'Year Built',
+                'notes': 'Notes',
+                'saved_date': 'Saved'
+            },
+            key='saved_props_editor'
+        )
+
+        to_delete = edited.loc[edited['delete'], 'id']
+        if len(to_delete):
+            for pid in to_delete:
+                st.session_state.properties.pop(pid, None)
+            st.rerun()
+
+else:
     st.header("ℹ️ About This Tool")
     
     st.markdown("""